@@ -9,14 +9,42 @@ Version 3.0: Layout-based configuration with embossed text
 import FreeCAD
 import Part
 import Mesh
-import Draft
 import os
 import math
 import json
+import functools
+import hashlib
 
 # Golden ratio constant
 PHI = (1 + math.sqrt(5)) / 2  # Approximately 1.618...
 
+# Golden spiral decay rate: r = a * PHI**(-theta / (pi/2)) = a * exp(-SPIRAL_K * theta)
+SPIRAL_K = math.log(PHI) / (math.pi / 2)
+# Arc length per unit radius lost along the spiral: s = (r1 - r2) * SPIRAL_ARC_FACTOR
+SPIRAL_ARC_FACTOR = math.sqrt(1 + SPIRAL_K * SPIRAL_K) / SPIRAL_K
+
+DEG2RAD = math.pi / 180
+
+# Shared axis constants (never modified in place)
+Y_AXIS = FreeCAD.Vector(0, 1, 0)
+Z_AXIS = FreeCAD.Vector(0, 0, 1)
+
+# Per-key logging is noisy and slows large layouts; set CAD_DEBUG=1 to enable it
+DEBUG = bool(os.environ.get("CAD_DEBUG"))
+
+# Spiral plane -> (cos axis, sin axis, normal axis) indices into (x, y, z)
+SPIRAL_PLANE_AXES = {
+    'xz': (0, 2, 1),
+    'xy': (0, 1, 2),
+    'yz': (1, 2, 0),
+}
+
+# On-disk cache for BREP shapes converted from STL meshes (survives warm-pool reuse)
+SHAPE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cad-models")
+# Bump whenever load_centered_shape's load/centering/tolerance logic changes,
+# so warm containers stop serving BREPs built the old way
+SHAPE_CACHE_VERSION = 2
+
 print("=== Left-hand split keyboard with embossed labels ===")
 
 # Document setup
@@ -47,6 +75,8 @@ mount_offset = params.get('mountOffset', 17.5)
 enable_labels = params.get('enableLabels', False)
 text_height = params.get('textHeight', 3)  # mm tall
 text_depth = params.get('textDepth', 0.5)  # mm emboss depth
+fuse_text = params.get('fuseText', False)  # boolean-fuse text into keycap (slow) vs compound
+render_spiral = params.get('renderSpiral', False)  # golden spiral guide tube (visual aid only)
 layout = params.get('layout', [])
 
 # Collect text labels for annotations (rendered by frontend)
@@ -63,8 +93,8 @@ def create_embossed_text(label, keycap_width_mm, text_height_mm, text_depth_mm):
     """
     Create embossed text for a keycap.
 
-    NOTE: 3D text geometry is not supported in FreeCAD 0.19.
-    Text labels are collected and rendered as annotations in the frontend viewer instead.
+    NOTE: 3D text geometry is currently disabled. Text labels are collected
+    and rendered as annotations in the frontend viewer instead.
 
     Args:
         label: Text to emboss
@@ -79,23 +109,29 @@ def create_embossed_text(label, keycap_width_mm, text_height_mm, text_depth_mm):
     # The frontend viewer will render them as overlays on the 3D model
     return None
 
-    # Original 3D text code disabled (Draft.makeShapeString not available in FreeCAD 0.19):
+    # 3D text stays disabled while labels are frontend annotations: emitting
+    # geometry too would duplicate every label and add text solids to the
+    # exported keycap STLs. Kept for when embossed labels are wanted again.
+    # Builds the outlines with Part.makeWireString directly, so no temporary
+    # document object is created, recomputed and removed per label.
     try:
-        # Create text shape using Draft module
         font_file = "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
         if not os.path.exists(font_file):
             # Fallback to any available font
             font_file = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 
-        # Create the text string shape
-        text_obj = None  # Draft.makeShapeString not available
+        # One list of outline wires per character; Bullseye keeps inner loops as holes
+        char_wires = Part.makeWireString(label, font_file, text_height_mm)
+        char_faces = [
+            Part.makeFace(wires, 'Part::FaceMakerBullseye')
+            for wires in char_wires if wires
+        ]
 
-        if not text_obj or not hasattr(text_obj, 'Shape'):
+        if not char_faces:
             print(f"  WARNING: Could not create text shape for '{label}'")
             return None
 
-        text_shape = text_obj.Shape
-        doc.removeObject(text_obj.Name)  # Clean up temporary object
+        text_shape = Part.Compound(char_faces)
 
         # Get text bounding box to center it
         bbox = text_shape.BoundBox
@@ -113,12 +149,12 @@ def create_embossed_text(label, keycap_width_mm, text_height_mm, text_depth_mm):
             text_width = bbox.XMax - bbox.XMin
             text_actual_height = bbox.YMax - bbox.YMin
 
-        # Center the text using transform matrix
+        # Center the text and sink it half its depth below the keycap surface
+        # for embossing. A rigid move only sets the shape's location, so use
+        # translate rather than rebuilding geometry with transformGeometry.
         offset_x = -text_width / 2
         offset_y = -text_actual_height / 2
-        translate_matrix = FreeCAD.Matrix()
-        translate_matrix.move(FreeCAD.Vector(offset_x, offset_y, 0))
-        text_shape = text_shape.transformGeometry(translate_matrix)
+        text_shape.translate(FreeCAD.Vector(offset_x, offset_y, -text_depth_mm * 0.5))
 
         # Extrude the text to create 3D embossing
         text_3d = text_shape.extrude(FreeCAD.Vector(0, 0, text_depth_mm))
@@ -135,7 +171,14 @@ def create_embossed_text(label, keycap_width_mm, text_height_mm, text_depth_mm):
         return None
 
 
-def create_keycap_with_label(base_keycap_shape, label, key_width_u, text_height_mm, text_depth_mm, u_mm):
+# Width-scaled keycap shapes, keyed by rounded width in u. There is a single
+# base keycap per run. Scaling runs a full OCCT transformGeometry, and
+# layouts reuse few widths.
+scaled_keycap_cache = {}
+
+
+def create_keycap_with_label(base_keycap_shape, label, key_width_u, text_height_mm, text_depth_mm, u_mm,
+                             fuse_text=False):
     """
     Create a keycap with embossed label by scaling base keycap and adding text.
 
@@ -146,71 +189,44 @@ def create_keycap_with_label(base_keycap_shape, label, key_width_u, text_height_
         text_height_mm: Height of text
         text_depth_mm: Depth of embossing
         u_mm: Size of 1u in mm
+        fuse_text: Boolean-fuse the text into the keycap. Otherwise the two are
+            combined in a compound, which skips the expensive OCCT boolean and
+            is fine for display and slicing.
 
     Returns:
         Part.Shape of the keycap with label
     """
-    # Scale keycap horizontally if needed (Y-axis in our coordinate system)
-    if abs(key_width_u - 1.0) > 0.01:
-        # Scale only in Y direction
-        scale_matrix = FreeCAD.Matrix()
-        scale_matrix.scale(FreeCAD.Vector(1.0, key_width_u, 1.0))
-        keycap = base_keycap_shape.transformGeometry(scale_matrix)
-    else:
-        keycap = base_keycap_shape.copy()
+    # Scale keycap horizontally if needed (Y-axis in our coordinate system).
+    # Scaled shapes are shared per width: Part::Feature instances only differ
+    # by Placement, and nothing below modifies the shape in place.
+    cache_key = round(key_width_u, 3)
+    keycap = scaled_keycap_cache.get(cache_key)
+    if keycap is None:
+        if abs(key_width_u - 1.0) > 0.01:
+            # Scale only in Y direction
+            scale_matrix = FreeCAD.Matrix()
+            scale_matrix.scale(FreeCAD.Vector(1.0, key_width_u, 1.0))
+            keycap = base_keycap_shape.transformGeometry(scale_matrix)
+        else:
+            keycap = base_keycap_shape
+        scaled_keycap_cache[cache_key] = keycap
 
     # Create embossed text
     if label:
         text_shape = create_embossed_text(label, key_width_u * u_mm, text_height_mm, text_depth_mm)
         if text_shape and not text_shape.isNull():
-            # Position text on top of keycap (slightly below surface for embossing)
-            position_matrix = FreeCAD.Matrix()
-            position_matrix.move(FreeCAD.Vector(0, 0, -text_depth_mm * 0.5))
-            text_shape = text_shape.transformGeometry(position_matrix)
-
-            # Validate shape again after translation
-            if not text_shape.isNull():
-                # Fuse text with keycap
+            # Text is already positioned on the keycap surface by create_embossed_text
+            if fuse_text:
                 try:
                     keycap = keycap.fuse(text_shape)
                 except Exception as e:
                     print(f"  WARNING: Could not fuse text '{label}': {e}")
+            else:
+                keycap = Part.Compound([keycap, text_shape])
 
     return keycap
 
 
-def calculate_placement(position_index, key_count, u, hand_radius, pitch_angle):
-    """
-    Calculate placement for a component on the circular arc.
-
-    Args:
-        position_index: Position in row (0 to key_count-1)
-        key_count: Total number of keys
-        u: Spacing between keys
-        hand_radius: Radius of circular arc
-        pitch_angle: Pitch angle in degrees
-
-    Returns:
-        (FreeCAD.Placement, angle_deg) tuple
-    """
-    # Calculate arc angle for this position
-    row_offset_y_linear = (position_index - (key_count - 1) / 2) * u
-    keycap_angle = row_offset_y_linear / hand_radius  # radians
-    keycap_angle_deg = math.degrees(keycap_angle)
-
-    # Position on the circular arc around X axis at height hand_radius
-    pos_x = 0
-    pos_y = hand_radius * math.sin(keycap_angle)
-    pos_z = hand_radius * (1 - math.cos(keycap_angle))
-
-    # Rotations: roll by the arc angle first, THEN pitch around Y
-    roll_rot = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), keycap_angle_deg)
-    pitch_rot = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), pitch_angle)
-    combined_rot = roll_rot.multiply(pitch_rot)
-
-    return FreeCAD.Placement(FreeCAD.Vector(pos_x, pos_y, pos_z), combined_rot), keycap_angle_deg
-
-
 def calculate_row_layout(keys, u_mm):
     """
     Calculate the position offsets and total width for a row of keys.
@@ -245,46 +261,127 @@ def calculate_row_layout(keys, u_mm):
     return positions, total_width
 
 
-def create_golden_spiral(start_diameter, arc_length_radians, tube_radius, center, plane_normal='xz', num_segments=100):
-    """Create a golden spiral as a swept tube."""
-    print(f"\n=== Creating Golden Spiral ===")
-    print(f"Start diameter: {start_diameter}mm, Arc length: {arc_length_radians:.3f} rad")
+@functools.lru_cache(maxsize=None)
+def calculate_local_transforms(key_positions, roll_radius, pitch_angle):
+    """
+    Compute row-local position and orientation for every key in a row at once.
 
-    a = start_diameter / 2
+    Each key is rolled about X by its arc angle, then pitched about Y. Rather
+    than building and multiplying two FreeCAD.Rotation objects per key, the
+    composed quaternion is written in closed form:
+    (cos a/2, sin a/2, 0, 0) * (cos p/2, 0, sin p/2, 0)
+    = (ca*cp, sa*cp, ca*sp, sa*sp), with the pitch terms computed once.
 
-    # Generate spiral points
-    points = []
-    for i in range(num_segments + 1):
-        theta = (arc_length_radians / num_segments) * i
-        r = a * (PHI ** (-theta / (math.pi / 2)))
+    Rows with the same key widths share identical local transforms, so
+    results are memoized; key_positions must be passed as a tuple.
 
-        if plane_normal.lower() == 'xz':
-            x = -r * math.cos(theta)
-            y = 0
-            z = r * math.sin(theta)
-        else:
-            raise ValueError(f"Unknown plane orientation: {plane_normal}")
+    Args:
+        key_positions: Tuple of (offset, width) tuples from calculate_row_layout
+        roll_radius: Radius of the row's circular arc
+        pitch_angle: Pitch angle in degrees
+
+    Returns:
+        List of row-local FreeCAD.Placement objects (shared between calls;
+        do not modify in place)
+    """
+    half_pitch = math.radians(pitch_angle) / 2
+    cp = math.cos(half_pitch)
+    sp = math.sin(half_pitch)
+
+    transforms = []
+    for key_offset_y, _ in key_positions:
+        keycap_angle = key_offset_y / roll_radius
+        ca = math.cos(keycap_angle / 2)
+        sa = math.sin(keycap_angle / 2)
+
+        # sin(a) = 2*sa*ca and 1 - cos(a) = 2*sa^2 reuse the half-angle terms
+        local_pos = FreeCAD.Vector(
+            0,
+            roll_radius * 2 * sa * ca,
+            roll_radius * 2 * sa * sa
+        )
+        # FreeCAD.Rotation takes quaternion components as (x, y, z, w)
+        local_rot = FreeCAD.Rotation(sa * cp, ca * sp, sa * sp, ca * cp)
+        transforms.append(FreeCAD.Placement(local_pos, local_rot))
 
-        point = FreeCAD.Vector(center.x + x, center.y + y, center.z + z)
-        points.append(point)
+    return transforms
 
-    # Create spiral curve
-    spiral_curve = Part.BSplineCurve()
-    spiral_curve.interpolate(points)
-    spiral_edge = spiral_curve.toShape()
 
-    # Create tube cross-section
-    tangent = points[1] - points[0]
-    tangent.normalize()
-    reference = FreeCAD.Vector(0, 1, 0)
-    normal = tangent.cross(reference)
-    normal.normalize()
+def spiral_points(start_diameter, arc_length_radians, num_segments, plane_normal='xz'):
+    """
+    Sample the golden spiral as plain (x, y, z) tuples.
+
+    Pure math with no FreeCAD objects, so the per-point work stays in plain
+    floats and the caller converts to FreeCAD.Vector once.
+
+    Args:
+        start_diameter: Diameter of the spiral at theta=0
+        arc_length_radians: Total sweep angle in radians
+        num_segments: Number of segments (returns num_segments + 1 points)
+        plane_normal: Plane the spiral lies in ('xz', 'xy' or 'yz')
+
+    Returns:
+        List of (x, y, z) tuples relative to the spiral center
+    """
+    try:
+        cos_axis, sin_axis, _ = SPIRAL_PLANE_AXES[plane_normal.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown plane orientation: {plane_normal}")
 
-    circle = Part.makeCircle(tube_radius, points[0], normal)
-    circle_wire = Part.Wire(circle)
+    step = arc_length_radians / num_segments
+    # Equal angle steps shrink the radius by a constant factor, so the radii
+    # form a geometric series: one pow up front instead of one per point
+    r = start_diameter / 2
+    r_ratio = math.exp(-SPIRAL_K * step)
 
-    # Sweep to create tube
-    spiral_tube = Part.Wire([spiral_edge]).makePipeShell([circle_wire], True, False)
+    points = []
+    for i in range(num_segments + 1):
+        theta = step * i
+        point = [0.0, 0.0, 0.0]
+        point[cos_axis] = -r * math.cos(theta)
+        point[sin_axis] = r * math.sin(theta)
+        points.append(tuple(point))
+        r *= r_ratio
+    return points
+
+
+def create_golden_spiral(start_diameter, arc_length_radians, tube_radius, center, plane_normal='xz', num_segments=24):
+    """
+    Create a golden spiral as a swept tube.
+
+    The tube is only a visual guide, so the path is a polyline through a
+    handful of samples rather than a fitted BSpline. Straight edges skip
+    curve fitting and keep the pipe sweep cheap; the joints use right-corner
+    transitions so the tube stays closed, and the sweep itself orients the
+    profile so no tangent/normal math is needed here.
+    """
+    print(f"\n=== Creating Golden Spiral ===")
+    print(f"Start diameter: {start_diameter}mm, Arc length: {arc_length_radians:.3f} rad")
+
+    # Generate spiral points
+    points = [
+        FreeCAD.Vector(center.x + x, center.y + y, center.z + z)
+        for x, y, z in spiral_points(start_diameter, arc_length_radians, num_segments, plane_normal)
+    ]
+
+    # Create spiral path as a polyline
+    spiral_path = Part.makePolygon(points)
+
+    # Create tube cross-section; the sweep orients it perpendicular to the path
+    circle_wire = Part.Wire(Part.makeCircle(tube_radius, points[0]))
+
+    # Sweep to create tube. The path is planar, so binormal mode along the
+    # plane normal gives a stable frame even on straight segments.
+    reference_axis = [0, 0, 0]
+    reference_axis[SPIRAL_PLANE_AXES[plane_normal.lower()][2]] = 1
+
+    pipe = Part.BRepOffsetAPI.MakePipeShell(spiral_path)
+    pipe.setBiNormalMode(FreeCAD.Vector(*reference_axis))
+    pipe.setTransitionMode(1)  # right-corner joints between segments
+    pipe.add(circle_wire, False, True)  # WithCorrection: rotate profile onto the path
+    pipe.build()
+    pipe.makeSolid()
+    spiral_tube = pipe.shape()
 
     print(f"Golden spiral created with {num_segments} segments")
     return spiral_tube
@@ -293,7 +390,7 @@ def create_golden_spiral(start_diameter, arc_length_radians, tube_radius, center
 def spiral_radius_at_angle(theta, start_diameter):
     """Calculate radius of golden spiral at given angle theta."""
     a = start_diameter / 2
-    return a * (PHI ** (-theta / (math.pi / 2)))
+    return a * math.exp(-SPIRAL_K * theta)
 
 
 def spiral_position_at_angle(theta, start_diameter, center=FreeCAD.Vector(0, 0, 0)):
@@ -308,8 +405,8 @@ def spiral_position_at_angle(theta, start_diameter, center=FreeCAD.Vector(0, 0,
 def spiral_tangent_at_angle(theta, start_diameter):
     """Calculate tangent vector to the spiral at given angle."""
     a = start_diameter / 2
-    r = a * (PHI ** (-theta / (math.pi / 2)))
-    dr_dtheta = -a * math.log(PHI) / (math.pi / 2) * (PHI ** (-theta / (math.pi / 2)))
+    r = a * math.exp(-SPIRAL_K * theta)
+    dr_dtheta = -SPIRAL_K * r
 
     dx_dtheta = -dr_dtheta * math.cos(theta) + r * math.sin(theta)
     dz_dtheta = dr_dtheta * math.sin(theta) + r * math.cos(theta)
@@ -322,57 +419,128 @@ def spiral_tangent_at_angle(theta, start_diameter):
 def spiral_normal_at_angle(theta, start_diameter):
     """Calculate outward normal vector to the spiral at given angle."""
     tangent = spiral_tangent_at_angle(theta, start_diameter)
-    y_axis = FreeCAD.Vector(0, 1, 0)
-    normal = tangent.cross(y_axis)
+    normal = tangent.cross(Y_AXIS)
     normal.normalize()
     return normal
 
 
-def find_theta_at_arc_distance(start_theta, arc_distance, start_diameter, tolerance=0.01, max_iterations=100):
-    """Find angle theta along spiral where arc length from start_theta equals arc_distance."""
-    def arc_length_from_start(end_theta, num_segments=50):
-        length = 0.0
-        for i in range(num_segments):
-            t1 = start_theta + (end_theta - start_theta) * i / num_segments
-            t2 = start_theta + (end_theta - start_theta) * (i + 1) / num_segments
-            p1 = spiral_position_at_angle(t1, start_diameter)
-            p2 = spiral_position_at_angle(t2, start_diameter)
-            length += p1.distanceToPoint(p2)
-        return length
+def find_theta_at_arc_distance(start_theta, arc_distance, start_diameter):
+    """
+    Find angle theta along spiral where arc length from start_theta equals arc_distance.
+
+    For a logarithmic spiral r = a*exp(-k*theta) the arc length between two
+    angles has the closed form s = (r1 - r2) * SPIRAL_ARC_FACTOR, which
+    inverts directly. The result is clamped to one full turn past start_theta
+    (the spiral's total remaining length is finite).
+    """
+    r_start = spiral_radius_at_angle(start_theta, start_diameter)
+    remaining = 1 - arc_distance / (SPIRAL_ARC_FACTOR * r_start)
 
-    theta_min = start_theta
     theta_max = start_theta + 2 * math.pi
+    if remaining <= 0:
+        return theta_max
+    return min(start_theta - math.log(remaining) / SPIRAL_K, theta_max)
+
 
-    for iteration in range(max_iterations):
-        theta_mid = (theta_min + theta_max) / 2
-        arc_len = arc_length_from_start(theta_mid)
+def load_centered_shape(stl_path, deflection=0.1):
+    """
+    Load an STL, center it in X/Y with its top at Z=0, and convert it to a shape.
 
-        if abs(arc_len - arc_distance) < tolerance:
-            return theta_mid
+    The mesh->BREP conversion dominates model build time, so results are
+    persisted as BREP files keyed by the STL's content hash, deflection and
+    SHAPE_CACHE_VERSION. The backend re-executes this script for every job,
+    so the on-disk cache is what carries over between builds. Content (not
+    mtime) addressing keeps it valid across fresh clones of the repo. The
+    returned shape is shared by every instance: callers must copy it before
+    mutating.
 
-        if arc_len < arc_distance:
-            theta_min = theta_mid
-        else:
-            theta_max = theta_mid
+    Args:
+        stl_path: Path to the STL file
+        deflection: Sewing tolerance passed to makeShapeFromMesh
+
+    Returns:
+        Part.Shape of the centered mesh
+    """
+    with open(stl_path, 'rb') as f:
+        stl_hash = hashlib.sha256(f.read()).hexdigest()
+    cache_key = f"v{SHAPE_CACHE_VERSION}_{stl_hash}_{deflection}"
+    cache_path = os.path.join(SHAPE_CACHE_DIR, cache_key + ".brep")
+
+    if os.path.exists(cache_path):
+        try:
+            shape = Part.Shape()
+            shape.importBrep(cache_path)
+            if shape.isNull() or not shape.isValid():
+                raise ValueError("null or invalid shape")
+            print(f"  Using cached shape: {cache_path}")
+            return shape
+        except Exception as e:
+            # Entries never expire, so drop a bad one rather than retry it every build
+            print(f"  WARNING: Discarding cached shape {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+
+    mesh = Mesh.Mesh(stl_path)
+    bbox = mesh.BoundBox
+
+    # Center the mesh (top at Z=0)
+    offset_x = -(bbox.XMin + bbox.XMax) / 2
+    offset_y = -(bbox.YMin + bbox.YMax) / 2
+    offset_z = -bbox.ZMax
+    mesh.translate(offset_x, offset_y, offset_z)
+
+    shape = Part.Shape()
+    shape.makeShapeFromMesh(mesh.Topology, deflection)
+
+    # Only cache shapes the read side would accept. Write to a temp file and
+    # rename it into place, so a task killed mid-write leaves no truncated BREP.
+    if shape.isValid():
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(SHAPE_CACHE_DIR, exist_ok=True)
+            shape.exportBrep(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"  WARNING: Could not write shape cache {cache_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return shape
+
+
+def add_baked_feature(doc, name, shape, placement=None):
+    """
+    Add a Part::Feature holding an already-built shape.
+
+    A plain Part::Feature has no execute() to run, so once its Shape and
+    Placement are set it is marked clean with purgeTouched(). Otherwise
+    doc.recompute() would walk every key for nothing.
+
+    Args:
+        doc: FreeCAD document to add the feature to
+        name: Object name
+        shape: Part.Shape to assign
+        placement: Optional FreeCAD.Placement
 
-    return (theta_min + theta_max) / 2
+    Returns:
+        The new Part::Feature
+    """
+    obj = doc.addObject("Part::Feature", name)
+    obj.Shape = shape
+    if placement is not None:
+        obj.Placement = placement
+    obj.purgeTouched()
+    return obj
 
 
 # Load base keycap mesh
 keycap_stl = os.path.join(script_dir, "kailh_choc_low_profile_keycap.stl")
 print(f"\nLoading keycap: {keycap_stl}")
 
-keycap_mesh = Mesh.Mesh(keycap_stl)
-bbox = keycap_mesh.BoundBox
-
-# Center the keycap mesh (top at Z=0)
-offset_x = -(bbox.XMin + bbox.XMax) / 2
-offset_y = -(bbox.YMin + bbox.YMax) / 2
-offset_z = -bbox.ZMax
-keycap_mesh.translate(offset_x, offset_y, offset_z)
-
-base_keycap_shape = Part.Shape()
-base_keycap_shape.makeShapeFromMesh(keycap_mesh.Topology, 0.1)
+base_keycap_shape = load_centered_shape(keycap_stl)
+bbox = base_keycap_shape.BoundBox
 
 print(f"Base keycap loaded: {bbox.XLength:.1f} x {bbox.YLength:.1f} x {bbox.ZLength:.1f} mm")
 
@@ -381,18 +549,7 @@ switch_stl = os.path.join(script_dir, "kailhlowprofilev102_fixed.stl")
 print(f"Loading switch: {switch_stl}")
 
 try:
-    switch_mesh = Mesh.Mesh(switch_stl)
-    switch_bbox = switch_mesh.BoundBox
-
-    switch_offset_x = -(switch_bbox.XMin + switch_bbox.XMax) / 2
-    switch_offset_y = -(switch_bbox.YMin + switch_bbox.YMax) / 2
-    switch_offset_z = -switch_bbox.ZMax
-
-    switch_mesh.translate(switch_offset_x, switch_offset_y, switch_offset_z)
-
-    switch_shape = Part.Shape()
-    switch_shape.makeShapeFromMesh(switch_mesh.Topology, 0.1)
-
+    switch_shape = load_centered_shape(switch_stl)
     print(f"Switch loaded successfully")
 except Exception as e:
     print(f"ERROR loading switch: {e}")
@@ -406,18 +563,7 @@ switchplate_stl = os.path.join(script_dir, "switchplate.stl")
 print(f"Loading switchplate: {switchplate_stl}")
 
 try:
-    switchplate_mesh = Mesh.Mesh(switchplate_stl)
-    switchplate_bbox = switchplate_mesh.BoundBox
-
-    switchplate_offset_x = -(switchplate_bbox.XMin + switchplate_bbox.XMax) / 2
-    switchplate_offset_y = -(switchplate_bbox.YMin + switchplate_bbox.YMax) / 2
-    switchplate_offset_z = -switchplate_bbox.ZMax
-
-    switchplate_mesh.translate(switchplate_offset_x, switchplate_offset_y, switchplate_offset_z)
-
-    switchplate_shape = Part.Shape()
-    switchplate_shape.makeShapeFromMesh(switchplate_mesh.Topology, 0.1)
-
+    switchplate_shape = load_centered_shape(switchplate_stl)
     print(f"Switchplate loaded successfully")
 except Exception as e:
     print(f"ERROR loading switchplate: {e}")
@@ -443,80 +589,70 @@ for row_idx, row_config in enumerate(layout):
 
     # Calculate key positions for this row
     key_positions, row_total_width = calculate_row_layout(keys, u)
+    local_transforms = calculate_local_transforms(tuple(key_positions), roll_radius, pitch_angle)
 
     # Get spiral position and orientation
     spiral_pos = spiral_position_at_angle(theta, hand_diameter)
     normal = spiral_normal_at_angle(theta, hand_diameter)
 
-    # Create consistent orientation for all rows
-    y_axis = FreeCAD.Vector(0, 1, 0)
-    z_axis = normal
-    x_axis = z_axis.cross(y_axis)
-    x_axis.normalize()
-    z_axis = x_axis.cross(y_axis)
-    z_axis.normalize()
-
+    # Create consistent orientation for all rows. The normal is a unit vector
+    # in the XZ plane and y stays fixed, so the frame follows in closed form:
+    # x = normal x Y = (-nz, 0, nx), z = x x Y = -normal
+    nx, nz = normal.x, normal.z
     local_to_global = FreeCAD.Rotation(
         FreeCAD.Matrix(
-            x_axis.x, y_axis.x, z_axis.x, 0,
-            x_axis.y, y_axis.y, z_axis.y, 0,
-            x_axis.z, y_axis.z, z_axis.z, 0,
+            -nz, 0, -nx, 0,
+            0, 1, 0, 0,
+            nx, 0, -nz, 0,
             0, 0, 0, 1
         )
     )
 
+    # Row-local -> global transform, composed with each key's local placement
+    row_placement = FreeCAD.Placement(spiral_pos, local_to_global)
+
     print(f"  Spiral pos: ({spiral_pos.x:.1f}, {spiral_pos.y:.1f}, {spiral_pos.z:.1f})")
 
     # Create each key in this row
-    for key_idx, (key, (key_offset_y, key_width_u)) in enumerate(zip(keys, key_positions)):
+    for key_idx, (key, (key_offset_y, key_width_u), local_placement) in enumerate(
+            zip(keys, key_positions, local_transforms)):
         label = key.get('label', '')
 
-        print(f"  Key {key_idx + 1}: '{label}' @ {key_offset_y:.1f}mm, {key_width_u}u")
-
-        # Calculate position along the curved row
-        keycap_angle = key_offset_y / roll_radius
-        keycap_angle_deg = math.degrees(keycap_angle)
-
-        local_pos_x = 0
-        local_pos_y = roll_radius * math.sin(keycap_angle)
-        local_pos_z = roll_radius * (1 - math.cos(keycap_angle))
-
-        # Local rotations
-        roll_rot = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), keycap_angle_deg)
-        pitch_rot = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), pitch_angle)
-        local_rot = roll_rot.multiply(pitch_rot)
+        if DEBUG:
+            print(f"  Key {key_idx + 1}: '{label}' @ {key_offset_y:.1f}mm, {key_width_u}u")
 
         # Transform to global coordinates
-        global_rotation = local_to_global.multiply(local_rot)
-        local_vec = FreeCAD.Vector(local_pos_x, local_pos_y, local_pos_z)
-        global_offset = local_to_global.multVec(local_vec)
-        global_position = spiral_pos.add(global_offset)
+        final_placement = row_placement.multiply(local_placement)
+        global_position = final_placement.Base
+        global_rotation = final_placement.Rotation
+
+        # Keycap, switch and switchplate share one rotation and differ only by
+        # an offset along the key's local Z axis, so rotate that axis once and
+        # build all three placements together
+        key_z_axis = global_rotation.multVec(Z_AXIS)
+        switch_placement = FreeCAD.Placement(global_position.add(key_z_axis * -switch_offset), global_rotation)
+        switchplate_placement = FreeCAD.Placement(global_position.add(key_z_axis * -mount_offset), global_rotation)
 
         # Create keycap with label (only if labels enabled)
         keycap_label = label if enable_labels else None
         keycap_with_label = create_keycap_with_label(
-            base_keycap_shape, keycap_label, key_width_u, text_height, text_depth, u
+            base_keycap_shape, keycap_label, key_width_u, text_height, text_depth, u, fuse_text
         )
 
-        final_placement = FreeCAD.Placement(global_position, global_rotation)
-
-        keycap_obj = doc.addObject("Part::Feature", f"Key_R{row_idx + 1:02d}_K{key_idx + 1:02d}_{label}")
-        keycap_obj.Shape = keycap_with_label
-        keycap_obj.Placement = final_placement
+        add_baked_feature(doc, f"Key_R{row_idx + 1:02d}_K{key_idx + 1:02d}_{label}",
+                          keycap_with_label, final_placement)
 
         # Collect text label for annotations (if enabled)
         if enable_labels and label:
-            # Position text slightly above the keycap surface
-            label_offset = FreeCAD.Vector(0, 0, 1.0)  # 1mm above keycap
-            global_label_offset = global_rotation.multVec(label_offset)
-            label_position = global_position.add(global_label_offset)
+            # Position text slightly above the keycap surface (1mm)
+            label_position = global_position.add(key_z_axis * 1.0)
 
             # Convert rotation to Euler angles (radians) for three.js
             euler_angles = global_rotation.toEuler()  # Returns (yaw, pitch, roll) in degrees
             rotation_radians = [
-                math.radians(euler_angles[1]),  # pitch (X)
-                math.radians(euler_angles[2]),  # roll (Y)
-                math.radians(euler_angles[0])   # yaw (Z)
+                euler_angles[1] * DEG2RAD,  # pitch (X)
+                euler_angles[2] * DEG2RAD,  # roll (Y)
+                euler_angles[0] * DEG2RAD   # yaw (Z)
             ]
 
             text_labels.append({
@@ -529,46 +665,35 @@ for row_idx, row_config in enumerate(layout):
             })
 
         # Create switch
-        local_switch_offset = FreeCAD.Vector(0, 0, -switch_offset)
-        global_switch_offset = global_rotation.multVec(local_switch_offset)
-        switch_position = global_position.add(global_switch_offset)
-        switch_placement = FreeCAD.Placement(switch_position, global_rotation)
-
-        switch_obj = doc.addObject("Part::Feature", f"Switch_R{row_idx + 1:02d}_K{key_idx + 1:02d}")
-        switch_obj.Shape = switch_shape
-        switch_obj.Placement = switch_placement
+        add_baked_feature(doc, f"Switch_R{row_idx + 1:02d}_K{key_idx + 1:02d}",
+                          switch_shape, switch_placement)
 
         # Create switchplate
         if switchplate_shape is not None:
-            local_switchplate_offset = FreeCAD.Vector(0, 0, -mount_offset)
-            global_switchplate_offset = global_rotation.multVec(local_switchplate_offset)
-            switchplate_position = global_position.add(global_switchplate_offset)
-            switchplate_placement = FreeCAD.Placement(switchplate_position, global_rotation)
-
-            switchplate_obj = doc.addObject("Part::Feature", f"Plate_R{row_idx + 1:02d}_K{key_idx + 1:02d}")
-            switchplate_obj.Shape = switchplate_shape
-            switchplate_obj.Placement = switchplate_placement
+            add_baked_feature(doc, f"Plate_R{row_idx + 1:02d}_K{key_idx + 1:02d}",
+                              switchplate_shape, switchplate_placement)
 
         total_keys += 1
 
     print(f"  Created {len(keys)} keys in row {row_idx + 1}")
 
-# Create golden spiral
-spiral_shape = create_golden_spiral(
-    start_diameter=hand_diameter,
-    arc_length_radians=2 * math.pi,
-    tube_radius=5.0,
-    center=FreeCAD.Vector(0, 0, 0),
-    plane_normal='xz',
-    num_segments=200
-)
+# Create golden spiral (pipe sweeps are slow; only when requested)
+if render_spiral:
+    spiral_shape = create_golden_spiral(
+        start_diameter=hand_diameter,
+        arc_length_radians=2 * math.pi,
+        tube_radius=5.0,
+        center=FreeCAD.Vector(0, 0, 0),
+        plane_normal='xz',
+        num_segments=24
+    )
 
-spiral_obj = doc.addObject("Part::Feature", "GoldenSpiral")
-spiral_obj.Shape = spiral_shape
+    add_baked_feature(doc, "GoldenSpiral", spiral_shape)
 
 doc.recompute()
 print(f"\nSUCCESS: Created {len(layout)} rows with {total_keys} total keys")
-print(f"  {total_keys} keycaps + {total_keys} switches + {total_keys} switchplates + 1 spiral = {len(doc.Objects)} objects")
+print(f"  {total_keys} keycaps + {total_keys} switches + {total_keys} switchplates"
+      f" + {1 if render_spiral else 0} spiral = {len(doc.Objects)} objects")
 
 # Save text labels as annotations for frontend rendering
 if enable_labels and text_labels:
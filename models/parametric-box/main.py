@@ -7,50 +7,87 @@ Backend provides 'doc' variable - we add objects to it
 
 import FreeCAD
 import Part
+import os
+import json
 
-print("Starting parametric box generation...")
-print(f"Using document: {doc.Name if 'doc' in dir() else 'Creating new for standalone'}")
-
-# If running standalone (not from backend), create doc
-if 'doc' not in dir():
-    doc = FreeCAD.newDocument("ParametricBox")
-    print("✓ Created new document (standalone mode)")
-else:
-    print("✓ Using provided document (backend mode)")
-
-# Parameters (can be customized)
-length = 150  # mm
-width = 100   # mm
-height = 50   # mm
-wall = 3      # mm wall thickness
-
-print(f"Parameters: {length}x{width}x{height}mm, wall={wall}mm")
-
-# Create outer box
-outer = Part.makeBox(length, width, height)
-print("✓ Outer box created")
-
-# Create inner cavity
-inner = Part.makeBox(
-    length - 2*wall,
-    width - 2*wall,
-    height - wall,
-    FreeCAD.Vector(wall, wall, wall)
-)
-print("✓ Inner cavity created")
-
-# Subtract inner from outer to create hollow box
-hollow_box = outer.cut(inner)
-print("✓ Hollow box created")
-
-# Add to document
-obj = doc.addObject("Part::Feature", "HollowBox")
-obj.Shape = hollow_box
-print("✓ Box added to document")
-
-# Recompute
-doc.recompute()
-print("✓ Document recomputed")
-
-print(f"✓ Parametric box generated successfully with {len(doc.Objects)} object(s)")
-print("SUCCESS: Model generation complete")
+def generate_model(doc, length=150, width=100, height=50, wall=3):
+    """
+    Add a HollowBox feature to doc, or update the existing one.
+
+    Importable so a long-running caller can build several sizes without
+    re-executing the script. Repeated calls on the same document swap the
+    Shape of the existing HollowBox instead of allocating a new document
+    or feature per size.
+
+    Args:
+        doc: FreeCAD document to add the box to
+        length, width, height: Outer dimensions in mm
+        wall: Wall thickness in mm
+
+    Returns:
+        The HollowBox Part::Feature
+    """
+    print(f"Parameters: {length}x{width}x{height}mm, wall={wall}mm")
+
+    # Create outer box
+    outer = Part.makeBox(length, width, height)
+    print("✓ Outer box created")
+
+    # Create inner cavity
+    inner = Part.makeBox(
+        length - 2*wall,
+        width - 2*wall,
+        height - wall,
+        FreeCAD.Vector(wall, wall, wall)
+    )
+    print("✓ Inner cavity created")
+
+    # Subtract inner from outer to create hollow box
+    hollow_box = outer.cut(inner)
+    print("✓ Hollow box created")
+
+    # Add to document, reusing the feature on repeated calls
+    obj = doc.getObject("HollowBox")
+    if obj is None:
+        obj = doc.addObject("Part::Feature", "HollowBox")
+        print("✓ Box added to document")
+    else:
+        print("✓ Existing box updated")
+    obj.Shape = hollow_box
+    return obj
+
+
+# Build only when executed (backend exec with an injected doc, or standalone);
+# importing the module for generate_model() has no side effects
+if 'doc' in globals() or __name__ == "__main__":
+    print("Starting parametric box generation...")
+    print(f"Using document: {doc.Name if 'doc' in globals() else 'Creating new for standalone'}")
+
+    # If running standalone (not from backend), create doc
+    if 'doc' not in globals():
+        doc = FreeCAD.newDocument("ParametricBox")
+        print("✓ Created new document (standalone mode)")
+    else:
+        print("✓ Using provided document (backend mode)")
+
+    # Parameters (can be customized here or via an optional input.json)
+    params = {}
+    input_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "input.json")
+    if os.path.exists(input_file):
+        with open(input_file, 'r') as f:
+            params = json.load(f)
+
+    generate_model(
+        doc,
+        length=params.get('length', 150),  # mm
+        width=params.get('width', 100),    # mm
+        height=params.get('height', 50),   # mm
+        wall=params.get('wall', 3),        # mm wall thickness
+    )
+
+    # Recompute
+    doc.recompute()
+    print("✓ Document recomputed")
+
+    print(f"✓ Parametric box generated successfully with {len(doc.Objects)} object(s)")
+    print("SUCCESS: Model generation complete")